@@ -1,2 +1,10 @@
 def main() -> None:
     print("Hello from elaiphant!")
+
+
+def clear_cache() -> None:
+    """Clears the cached EXPLAIN plans and LLM analysis results."""
+    from elaiphant import agent, db
+
+    db.clear_explain_cache()
+    agent.clear_analysis_cache()
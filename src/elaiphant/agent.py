@@ -1,7 +1,14 @@
+import functools
+import hashlib
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import orjson
+
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent
 
-from elaiphant.settings import settings
+from elaiphant.db import compact_plan, normalize_sql
+from elaiphant.settings import get_settings
 
 
 class QueryAnalysisInput(BaseModel):
@@ -28,10 +35,39 @@ class QueryAnalysisOutput(BaseModel):
     suggestions: list[OptimizationSuggestion] = Field(
         default_factory=list, description="List of optimization suggestions."
     )
+    confidence: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Confidence in the suggestions (0-1).",
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _agent_for(model: str) -> Agent[None, QueryAnalysisOutput]:
+    """Builds (and caches) a query-optimization agent for the given model string."""
+    # Kept deliberately terse: prefill latency and cost scale with input tokens.
+    system_prompt = (
+        "Suggest PostgreSQL optimizations for the given query + EXPLAIN ANALYZE: "
+        "indexes (CREATE INDEX ...), query rewrites, config changes. "
+        "Use the structured output format; empty list if none apply."
+    )
+
+    agent: Agent[None, QueryAnalysisOutput] = Agent(
+        model,
+        output_type=QueryAnalysisOutput,
+        system_prompt=system_prompt,
+        # tools=[], # Explicitly empty tools list
+        # instrument=True, # Consider enabling for Logfire integration later
+    )
+    return agent
 
 
 def create_optimizer_agent() -> Agent[None, QueryAnalysisOutput]:
-    """Creates a pydantic-ai agent configured for query optimization using settings.
+    """Returns the pydantic-ai agent configured for query optimization using settings.
+
+    The agent is cached per model string, so repeated calls don't re-wire the
+    system prompt and output validators.
 
     Returns:
         A configured pydantic_ai.Agent instance.
@@ -40,27 +76,127 @@ def create_optimizer_agent() -> Agent[None, QueryAnalysisOutput]:
         settings.ai_model: The LLM model string (e.g., 'openai:gpt-4o') from settings.
         Environment variables (e.g., OPENAI_API_KEY) for authentication, handled by pydantic-ai.
     """
-    system_prompt = """
-Analyze the provided PostgreSQL query and its EXPLAIN ANALYZE output.
-Your goal is to suggest optimizations to improve performance.
-Focus on actionable advice like:
-- Index recommendations (CREATE INDEX ...)
-- Query rewrites (alternative SQL formulations)
-- Relevant PostgreSQL configuration changes
-
-Return your suggestions using the available structured output format.
-If no suggestions are applicable, return an empty list of suggestions.
-"""
-
-    # Create the agent, passing the model string from settings
-    agent: Agent[None, QueryAnalysisOutput] = Agent(
-        settings.ai_model,  # Use model string from settings
-        output_type=QueryAnalysisOutput,
-        system_prompt=system_prompt,
-        # tools=[], # Explicitly empty tools list
-        # instrument=True, # Consider enabling for Logfire integration later
-    )
-    return agent
+    return _agent_for(get_settings().ai_model)
+
+
+def _compact_plan_text(explain_output: str) -> str:
+    """Compacts a JSON EXPLAIN plan for prompt embedding.
+
+    Non-JSON (e.g. text-format EXPLAIN) output is passed through unchanged.
+    """
+    try:
+        plan = orjson.loads(explain_output)
+    except orjson.JSONDecodeError:
+        return explain_output
+    if isinstance(plan, list):
+        plan = [compact_plan(p) if isinstance(p, dict) else p for p in plan]
+    elif isinstance(plan, dict):
+        plan = compact_plan(plan)
+    return orjson.dumps(plan).decode()
+
+
+# Analysis results keyed by (normalized_sql, plan_hash); bounded FIFO.
+_analysis_cache: Dict[Tuple[str, str], QueryAnalysisOutput] = {}
+_ANALYSIS_CACHE_MAX = 256
+
+
+def clear_analysis_cache() -> None:
+    """Clears the cached LLM analysis results."""
+    _analysis_cache.clear()
+
+
+def _plan_hash(plan_text: str) -> str:
+    """Short stable digest of the (compacted) plan text for cache keying."""
+    return hashlib.blake2b(plan_text.encode(), digest_size=16).hexdigest()
+
+
+def _parse_plan(explain_output: str) -> Optional[Dict[str, Any]]:
+    """Parses JSON EXPLAIN output into its first plan entry, or None."""
+    try:
+        plan = orjson.loads(explain_output)
+    except orjson.JSONDecodeError:
+        return None
+    if isinstance(plan, list):
+        plan = plan[0] if plan and isinstance(plan[0], dict) else None
+    return plan if isinstance(plan, dict) else None
+
+
+def _build_user_prompt(analysis_input: QueryAnalysisInput) -> str:
+    """Builds the per-request user prompt (no fences/filler to save tokens)."""
+    plan_text = _compact_plan_text(analysis_input.explain_analyze_output)
+    return f"SQL:\n{analysis_input.sql_query}\n\nPLAN:\n{plan_text}"
+
+
+# Escalate the fast model's output when it is this unsure, or when it finds
+# nothing on a plan with more nodes than this.
+_ESCALATION_CONFIDENCE = 0.5
+_ESCALATION_NODE_THRESHOLD = 4
+
+
+async def analyze_query_with_escalation(
+    analysis_input: QueryAnalysisInput,
+) -> QueryAnalysisOutput:
+    """Runs the fast triage model first, escalating only on uncertainty.
+
+    Simple queries get the cheap/fast tier's answer; the strong model (which
+    costs and takes several times more per token) only runs when the first
+    pass reports low confidence, or comes back empty on a non-trivial plan.
+
+    Args:
+        analysis_input: The input containing the SQL query and EXPLAIN output.
+
+    Returns:
+        The QueryAnalysisOutput from whichever tier answered.
+    """
+    # Build the prompt once and share it between tiers.
+    user_prompt = _build_user_prompt(analysis_input)
+    node_count = user_prompt.count('"Node Type"')
+
+    settings = get_settings()
+    fast_agent = _agent_for(settings.ai_model_fast)
+    result = await fast_agent.run(user_prompt)
+    output = result.output
+
+    if output.confidence < _ESCALATION_CONFIDENCE or (
+        not output.suggestions and node_count > _ESCALATION_NODE_THRESHOLD
+    ):
+        strong_agent = _agent_for(settings.ai_model_strong or settings.ai_model)
+        result = await strong_agent.run(user_prompt)
+        output = result.output
+    return output
+
+
+async def analyze_query_with_agent_stream(
+    agent: Agent[None, QueryAnalysisOutput], analysis_input: QueryAnalysisInput
+) -> AsyncIterator[OptimizationSuggestion]:
+    """Streams optimization suggestions as the model completes them.
+
+    Yields each suggestion as soon as it appears in the partially-validated
+    structured output, so callers see the first suggestion after roughly one
+    suggestion's worth of decoding instead of waiting for the full list.
+
+    Args:
+        agent: The configured pydantic_ai.Agent instance.
+        analysis_input: The input containing the SQL query and EXPLAIN output.
+
+    Yields:
+        OptimizationSuggestion items, in generation order.
+    """
+    user_prompt = _build_user_prompt(analysis_input)
+
+    seen = 0
+    async with agent.run_stream(user_prompt) as result:
+        async for partial in result.stream(debounce_by=0.1):
+            suggestions = partial.suggestions
+            # Partial validation tolerates a trailing truncated string, so the
+            # newest suggestion may still be mid-generation — hold it back
+            # until a later partial (or the final output) completes it.
+            for suggestion in suggestions[seen : len(suggestions) - 1]:
+                yield suggestion
+            seen = max(seen, len(suggestions) - 1)
+        output = await result.get_output()
+    for suggestion in output.suggestions[seen:]:
+        yield suggestion
 
 
 async def analyze_query_with_agent(
@@ -68,31 +204,41 @@ async def analyze_query_with_agent(
 ) -> QueryAnalysisOutput:
     """Runs the optimizer agent with the given query input.
 
+    Non-streaming counterpart of analyze_query_with_agent_stream; returns
+    the model's fully-validated output, confidence included.
+
     Args:
         agent: The configured pydantic_ai.Agent instance.
         analysis_input: The input containing the SQL query and EXPLAIN output.
 
+    Results are memoized on (normalized_sql, plan_hash), so re-analyzing an
+    unchanged query skips the LLM call entirely. Use clear_analysis_cache()
+    to invalidate.
+
     Returns:
         The QueryAnalysisOutput containing optimization suggestions.
     """
-    # Construct the user message part of the prompt
-    user_prompt = f"""
-SQL Query:
-```sql
-{analysis_input.sql_query}
-```
-
-EXPLAIN ANALYZE Output:
-```
-{analysis_input.explain_analyze_output}
-```
-
-Please provide optimization suggestions.
-"""
-
-    # Run the agent
-    # pydantic-ai handles calling the LLM, structuring the prompt,
-    # and validating the output against QueryAnalysisOutput.
-    result = await agent.run(user_prompt)
-
-    return result.output
+    # Imported here to avoid a module-level cycle (heuristics uses our models).
+    from elaiphant.heuristics import cheap_suggestions, plan_depth
+
+    cache_key = (
+        normalize_sql(analysis_input.sql_query),
+        _plan_hash(_compact_plan_text(analysis_input.explain_analyze_output)),
+    )
+    if cache_key in _analysis_cache:
+        return _analysis_cache[cache_key]
+
+    # Mechanical cases (e.g. a big unindexed Seq Scan filter on a shallow
+    # plan) don't need an LLM round-trip at all.
+    parsed_plan = _parse_plan(analysis_input.explain_analyze_output)
+    if parsed_plan is not None:
+        rule_based = cheap_suggestions(parsed_plan)
+        if rule_based and plan_depth(parsed_plan.get("Plan", parsed_plan)) < 4:
+            return QueryAnalysisOutput(suggestions=rule_based)
+
+    result = await agent.run(_build_user_prompt(analysis_input))
+    output = result.output
+    if len(_analysis_cache) >= _ANALYSIS_CACHE_MAX:
+        _analysis_cache.pop(next(iter(_analysis_cache)))
+    _analysis_cache[cache_key] = output
+    return output
@@ -1,263 +1,628 @@
+import asyncio
 import psycopg
 import logging
-from psycopg import rows
-from psycopg.sql import SQL
-from typing import Optional, List, Dict, Any, Tuple, Iterator, cast
+import re
+from uuid import uuid4
+from psycopg import AsyncConnection, rows
+from psycopg.sql import SQL, Identifier
+from psycopg_pool import AsyncConnectionPool
+from typing import (
+    Optional,
+    List,
+    Dict,
+    Any,
+    Tuple,
+    AsyncIterator,
+    Iterable,
+    Sequence,
+    cast,
+)
 from typing_extensions import LiteralString
-from contextlib import contextmanager
+from collections import defaultdict
+from contextlib import asynccontextmanager
 
-from elaiphant.settings import settings
+from elaiphant.settings import get_settings
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_pool: Optional[AsyncConnectionPool] = None
+_pool_dsn: Optional[str] = None
 
-@contextmanager
-def get_db_connection() -> Iterator[psycopg.Connection]:
-    """Provides a transactional database connection context."""
-    if not settings.database_url:
+
+async def _get_pool(dsn: Optional[str] = None) -> AsyncConnectionPool:
+    """Returns the process-wide connection pool, (re)creating it lazily.
+
+    The pool is keyed on the DSN so that a settings change (e.g. in tests)
+    transparently swaps in a pool for the new database.
+    """
+    global _pool, _pool_dsn
+
+    dsn = dsn or get_settings().dsn_str
+    if not dsn:
         raise ConnectionError("Database URL is not configured.")
 
-    dsn = str(settings.database_url)
-    logger.debug(f"Attempting connection using DSN: {dsn}")
-    conn: Optional[psycopg.Connection] = None
+    if _pool is None or _pool_dsn != dsn:
+        if _pool is not None:
+            logger.debug("Database URL changed, closing existing connection pool.")
+            await _pool.close()
+        logger.debug("Opening connection pool for DSN: %s", dsn)
+        _pool = AsyncConnectionPool(
+            conninfo=dsn,
+            min_size=4,
+            max_size=20,
+            max_idle=300,
+            kwargs={"prepare_threshold": 0},
+            open=False,
+        )
+        await _pool.open()
+        _pool_dsn = dsn
+    return _pool
+
+
+async def close_db_pool() -> None:
+    """Closes the connection pool.
+
+    Call on application shutdown, or after mutating settings/env vars to
+    force the next acquisition to reconnect with the new credentials.
+    """
+    global _pool, _pool_dsn
+    if _pool is not None:
+        logger.debug("Closing connection pool.")
+        await _pool.close()
+        _pool = None
+        _pool_dsn = None
+
+
+@asynccontextmanager
+async def get_db_connection(
+    dsn: Optional[str] = None,
+) -> AsyncIterator[AsyncConnection]:
+    """Provides a pooled, transactional database connection context.
+
+    The pool commits the transaction on clean exit and rolls back on error
+    before returning the connection for reuse.
+
+    Args:
+        dsn: Explicit database URL; defaults to the configured settings DSN.
+            Lets callers (notably tests) target a database without mutating
+            the global settings.
+    """
+    pool = await _get_pool(dsn)
     try:
-        conn = psycopg.connect(dsn)
-        assert conn is not None
-        logger.debug(f"Connection successful to: {conn.info.dbname}")
-        yield conn
-        if conn and not conn.closed:
-            if conn.info.transaction_status == psycopg.pq.TransactionStatus.IDLE:
-                try:
-                    logger.debug("Committing transaction.")
-                    conn.commit()
-                except psycopg.Error as e:
-                    logger.error(f"Commit failed, attempting rollback: {e}")
-                    try:
-                        conn.rollback()
-                    except psycopg.Error as rb_exc:
-                        logger.error(
-                            f"Rollback after failed commit also failed: {rb_exc}"
-                        )
-                    raise
-            elif conn.info.transaction_status == psycopg.pq.TransactionStatus.INERROR:
-                logger.warning(
-                    "Connection in error state at end of context, rolling back."
-                )
-                try:
-                    conn.rollback()
-                except psycopg.Error as rb_exc:
-                    logger.error(f"Rollback for INERROR state failed: {rb_exc}")
-            else:
-                logger.debug(
-                    f"Connection ended with status: {conn.info.transaction_status}. No commit/rollback needed by context manager."
-                )
+        async with pool.connection() as conn:
+            logger.debug("Acquired pooled connection to: %s", conn.info.dbname)
+            yield conn
     except psycopg.Error as e:
-        logger.error(f"Database connection or operation failed: {e}")
-        if conn and not conn.closed:
-            try:
-                logger.debug("Rolling back transaction due to error.")
-                conn.rollback()
-            except psycopg.Error as rb_exc:
-                logger.error(f"Rollback following operation error failed: {rb_exc}")
+        logger.error("Database connection or operation failed: %s", e)
         raise
-    finally:
-        if conn and not conn.closed:
-            logger.debug("Closing connection.")
-            conn.close()
 
 
-def execute_query(
+# Composed once at import; only the target statement varies per call.
+_EXPLAIN_TEMPLATE = SQL("EXPLAIN (ANALYZE, VERBOSE, BUFFERS, FORMAT JSON) {}")
+_EXPLAIN_NO_ANALYZE_TEMPLATE = SQL("EXPLAIN (VERBOSE, FORMAT JSON) {}")
+
+# Static metadata queries, allocated once at import. No composition needed,
+# so they stay plain strings.
+_LIST_TABLES_SQL = (
+    "SELECT table_name FROM information_schema.tables WHERE table_schema = 'public';"
+)
+_TABLE_SCHEMA_SQL = "SELECT column_name, data_type FROM information_schema.columns WHERE table_name = %s AND table_schema = 'public';"
+_TABLE_INDEXES_SQL = (
+    "SELECT indexname FROM pg_indexes WHERE tablename = %s AND schemaname = 'public';"
+)
+_SCHEMAS_BULK_SQL = "SELECT table_name, column_name, data_type FROM information_schema.columns WHERE table_schema = 'public' AND table_name = ANY(%s);"
+_INDEXES_BULK_SQL = "SELECT tablename, indexname FROM pg_indexes WHERE schemaname = 'public' AND tablename = ANY(%s);"
+
+_SQL_COMMENT_RE = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_SQL_WHITESPACE_RE = re.compile(r"\s+")
+
+# EXPLAIN plans keyed by (normalized_sql, params); bounded FIFO.
+_explain_cache: Dict[Tuple[str, Optional[Tuple[Any, ...]]], List[Dict[str, Any]]] = {}
+_EXPLAIN_CACHE_MAX = 256
+
+
+def normalize_sql(sql: str) -> str:
+    """Normalizes SQL for cache keying: strips comments, collapses whitespace."""
+    return _SQL_WHITESPACE_RE.sub(" ", _SQL_COMMENT_RE.sub(" ", sql)).strip()
+
+
+def clear_explain_cache() -> None:
+    """Clears the cached EXPLAIN ANALYZE plans (e.g. after schema changes)."""
+    _explain_cache.clear()
+
+
+async def get_explain_analyze_cached(
     sql: str,
     params: Optional[Tuple[Any, ...]] = None,
-    conn: Optional[psycopg.Connection] = None,
+    conn: Optional[AsyncConnection] = None,
 ) -> List[Dict[str, Any]]:
-    """Executes a SQL query. Uses provided connection or creates a new one."""
-    logger.info(
-        f"Executing query: {sql}" + (f" with params: {params}" if params else "")
-    )
+    """Like get_explain_analyze, but memoized on (normalized_sql, params).
+
+    Iterative optimization re-analyzes the same query repeatedly; cache hits
+    skip the EXPLAIN ANALYZE round-trip (which re-executes the query).
+    Call clear_explain_cache() after schema or data changes.
+    """
+    key = (normalize_sql(sql), params)
+    if key in _explain_cache:
+        logger.debug("EXPLAIN cache hit for: %s", key[0])
+        return _explain_cache[key]
+    plan = await get_explain_analyze(sql, params, conn=conn)
+    if len(_explain_cache) >= _EXPLAIN_CACHE_MAX:
+        _explain_cache.pop(next(iter(_explain_cache)))
+    _explain_cache[key] = plan
+    return plan
+
+
+# Plan fields worth keeping when shipping a plan to the LLM; everything else
+# ("Schema", "Alias", "Output", per-worker duplicates, ...) is token noise.
+_PLAN_KEEP_KEYS = frozenset(
+    {
+        "Node Type",
+        "Relation Name",
+        "Actual Rows",
+        "Plan Rows",
+        "Actual Total Time",
+        "Shared Hit Blocks",
+        "Shared Read Blocks",
+        "Index Name",
+        "Filter",
+        "Rows Removed by Filter",
+        "Hash Cond",
+        "Join Type",
+        "Execution Time",
+    }
+)
+
+
+def compact_plan(plan: Dict[str, Any]) -> Dict[str, Any]:
+    """Strips low-signal fields from an EXPLAIN (FORMAT JSON) plan tree.
+
+    Keeps only the fields that matter for optimization reasoning and recurses
+    into nested 'Plan'/'Plans' nodes, typically shrinking the payload sent to
+    the LLM by well over half.
+    """
+    compacted = {k: v for k, v in plan.items() if k in _PLAN_KEEP_KEYS}
+    if "Plan" in plan:
+        compacted["Plan"] = compact_plan(plan["Plan"])
+    if "Plans" in plan:
+        compacted["Plans"] = [compact_plan(p) for p in plan["Plans"]]
+    return compacted
+
+
+async def gather_query_context(
+    sql: str,
+    params: Optional[Tuple[Any, ...]] = None,
+    tables_of_interest: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Collects the EXPLAIN plan and table metadata for a query on one connection.
+
+    Uses psycopg's pipeline mode so the plan and metadata queries are queued
+    on a single pooled connection instead of paying a round-trip each.
+
+    Args:
+        sql: The SQL query to gather context for.
+        params: Optional query parameters.
+        tables_of_interest: Tables to fetch schema/index details for.
+            Defaults to all tables in the public schema.
+
+    Returns:
+        A dict with keys 'plan', 'tables', 'schemas' and 'indexes'.
+    """
+    async with get_db_connection() as conn:
+        async with conn.pipeline():
+            plan = await get_explain_analyze(sql, params, conn=conn)
+            tables = await list_tables(conn=conn)
+            if tables_of_interest is None:
+                tables_of_interest = tables
+            schemas = {
+                t: await get_table_schema(t, conn=conn) for t in tables_of_interest
+            }
+            indexes = {
+                t: await get_table_indexes(t, conn=conn) for t in tables_of_interest
+            }
+    return {"plan": plan, "tables": tables, "schemas": schemas, "indexes": indexes}
+
+
+async def execute_query(
+    sql: str,
+    params: Optional[Tuple[Any, ...]] = None,
+    conn: Optional[AsyncConnection] = None,
+    binary: bool = False,
+) -> List[Dict[str, Any]]:
+    """Executes a SQL query. Uses provided connection or acquires one from the pool.
+
+    Args:
+        binary: Opt into PostgreSQL's binary wire format, skipping text
+            encode/decode of parameters and results (e.g. int rows arrive as
+            4 bytes, not digit strings). Off by default: some types (aclitem,
+            ...) have no binary output function and would make the query fail.
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Executing query: %s%s", sql, f" with params: {params}" if params else ""
+        )
     results: List[Dict[str, Any]] = []
 
-    def _fetch_results(cursor: psycopg.Cursor[rows.DictRow]) -> List[Dict[str, Any]]:
-        cursor.execute(SQL(cast(LiteralString, sql)), params)
+    async def _fetch_results(
+        cursor: psycopg.AsyncCursor[rows.DictRow],
+    ) -> List[Dict[str, Any]]:
+        # Plain string execute: no Composable allocation for already-formed SQL.
+        await cursor.execute(cast(LiteralString, sql), params, binary=binary)
         if cursor.description:
-            return cursor.fetchall()
+            # Accumulate in fetchmany batches rather than one giant fetchall
+            # allocation; keeps the event loop responsive on wide results.
+            fetched: List[Dict[str, Any]] = []
+            while batch := await cursor.fetchmany(1000):
+                fetched.extend(batch)
+            return fetched
         else:
             logger.info(
-                f"Query executed successfully, no rows returned (Status: {cursor.statusmessage})."
+                "Query executed successfully, no rows returned (Status: %s).",
+                cursor.statusmessage,
             )
             return []
 
     try:
         if conn:
-            with conn.cursor(row_factory=rows.dict_row) as cur:
-                results = _fetch_results(cur)
+            async with conn.cursor(row_factory=rows.dict_row) as cur:
+                results = await _fetch_results(cur)
         else:
-            with get_db_connection() as new_conn:
-                with new_conn.cursor(row_factory=rows.dict_row) as cur:
-                    results = _fetch_results(cur)
+            async with get_db_connection() as new_conn:
+                async with new_conn.cursor(row_factory=rows.dict_row) as cur:
+                    results = await _fetch_results(cur)
     except psycopg.Error as e:
-        logger.error(f"Failed to execute query: {sql}. Error: {e}")
+        logger.error("Failed to execute query: %s. Error: %s", sql, e)
         raise
     return results
 
 
-def get_explain_analyze(
+async def execute_many(
     sql: str,
-    params: Optional[Tuple[Any, ...]] = None,
-    conn: Optional[psycopg.Connection] = None,
-) -> List[Dict[str, List[Dict[str, Any]]]]:
-    """Executes EXPLAIN ANALYZE. Uses provided connection or creates a new one."""
-    explain_template = SQL(
-        cast(LiteralString, "EXPLAIN (ANALYZE, VERBOSE, BUFFERS, FORMAT JSON) {}")
-    )
-    explain_sql = explain_template.format(SQL(cast(LiteralString, sql)))
+    params_seq: Sequence[Tuple[Any, ...]],
+    conn: Optional[AsyncConnection] = None,
+) -> None:
+    """Executes a statement once per parameter set in a single batched round-trip.
+
+    psycopg's executemany pipelines the whole batch through libpq, which is
+    orders of magnitude faster than looping execute for bulk INSERTs.
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Executing batch of %d: %s", len(params_seq), sql)
+
+    async def _run_batch(cursor: psycopg.AsyncCursor) -> None:
+        await cursor.executemany(cast(LiteralString, sql), params_seq)
+
+    try:
+        if conn:
+            async with conn.cursor() as cur:
+                await _run_batch(cur)
+        else:
+            async with get_db_connection() as new_conn:
+                async with new_conn.cursor() as cur:
+                    await _run_batch(cur)
+    except psycopg.Error as e:
+        logger.error("Failed to execute batch: %s. Error: %s", sql, e)
+        raise
+
+
+async def batch_execute(
+    queries: Sequence[Tuple[str, Optional[Tuple[Any, ...]]]],
+    conn: Optional[AsyncConnection] = None,
+) -> List[List[Dict[str, Any]]]:
+    """Executes independent queries in one pipelined network flush.
+
+    The statements are queued through psycopg's pipeline mode and their
+    result sets are returned in submission order, so N small queries cost
+    roughly one round-trip instead of N.
+
+    Args:
+        queries: (sql, params) pairs; params may be None.
+        conn: Optional connection; defaults to one from the pool.
+
+    Returns:
+        One list of dict rows per query, in the same order.
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Executing pipelined batch of %d queries", len(queries))
 
-    logger.info(
-        f"Getting EXPLAIN ANALYZE for: {sql}"
-        + (f" with params: {params}" if params else "")
+    async def _run_pipeline(connection: AsyncConnection) -> List[List[Dict[str, Any]]]:
+        cursors: List[psycopg.AsyncCursor[rows.DictRow]] = []
+        async with connection.pipeline():
+            for sql, params in queries:
+                cur = connection.cursor(row_factory=rows.dict_row)
+                await cur.execute(cast(LiteralString, sql), params)
+                cursors.append(cur)
+        results: List[List[Dict[str, Any]]] = []
+        for cur in cursors:
+            results.append(await cur.fetchall() if cur.description else [])
+            await cur.close()
+        return results
+
+    try:
+        if conn:
+            return await _run_pipeline(conn)
+        async with get_db_connection() as new_conn:
+            return await _run_pipeline(new_conn)
+    except psycopg.Error as e:
+        logger.error("Failed to execute pipelined batch. Error: %s", e)
+        raise
+
+
+async def copy_from(
+    table: str,
+    columns: List[str],
+    rows_iter: Iterable[Tuple[Any, ...]],
+    conn: Optional[AsyncConnection] = None,
+) -> None:
+    """Bulk-loads rows into a table via the COPY protocol — PostgreSQL's fast path."""
+    copy_sql = SQL("COPY {} ({}) FROM STDIN").format(
+        Identifier(table), SQL(", ").join(Identifier(c) for c in columns)
     )
-    plan: List[Dict[str, List[Dict[str, Any]]]] = []
+    logger.info("COPYing rows into table: %s", table)
 
-    def _fetch_plan(
-        cursor: psycopg.Cursor[rows.DictRow],
-    ) -> List[Dict[str, List[Dict[str, Any]]]]:
-        cursor.execute(explain_sql, params)
-        fetched_plan = cursor.fetchall()
-        if not fetched_plan:
-            logger.error(f"EXPLAIN ANALYZE for query '{sql}' returned no plan.")
-            raise psycopg.Error("EXPLAIN ANALYZE did not return any plan.")
-        return fetched_plan
+    async def _copy_rows(cursor: psycopg.AsyncCursor) -> None:
+        async with cursor.copy(copy_sql) as cp:
+            for row in rows_iter:
+                await cp.write_row(row)
 
     try:
         if conn:
-            with conn.cursor(row_factory=rows.dict_row) as cur:
-                plan = _fetch_plan(cur)
+            async with conn.cursor() as cur:
+                await _copy_rows(cur)
         else:
-            with get_db_connection() as new_conn:
-                with new_conn.cursor(row_factory=rows.dict_row) as cur:
-                    plan = _fetch_plan(cur)
+            async with get_db_connection() as new_conn:
+                async with new_conn.cursor() as cur:
+                    await _copy_rows(cur)
     except psycopg.Error as e:
-        logger.error(f"Failed to execute EXPLAIN ANALYZE for query: {sql}. Error: {e}")
+        logger.error("Failed to COPY into table %s. Error: %s", table, e)
         raise
 
-    return plan
 
+async def stream_query(
+    sql: str,
+    params: Optional[Tuple[Any, ...]] = None,
+    conn: Optional[AsyncConnection] = None,
+    itersize: int = 1000,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Streams a query's rows via a server-side cursor.
+
+    Unlike execute_query, rows are fetched from the server in chunks of
+    `itersize`, so peak memory is bounded by the chunk size instead of the
+    full result set. The connection is held until the generator is exhausted.
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Streaming query: %s%s", sql, f" with params: {params}" if params else ""
+        )
+    cursor_name = f"elaiphant_{uuid4().hex}"
+
+    async def _stream(connection: AsyncConnection) -> AsyncIterator[Dict[str, Any]]:
+        async with connection.cursor(
+            name=cursor_name, row_factory=rows.dict_row
+        ) as cur:
+            cur.itersize = itersize
+            await cur.execute(cast(LiteralString, sql), params)
+            async for row in cur:
+                yield row
 
-def get_explain_analyze_refined(
+    try:
+        if conn:
+            async for row in _stream(conn):
+                yield row
+        else:
+            async with get_db_connection() as new_conn:
+                async for row in _stream(new_conn):
+                    yield row
+    except psycopg.Error as e:
+        logger.error("Failed to stream query: %s. Error: %s", sql, e)
+        raise
+
+
+async def get_explain_analyze(
     sql: str,
     params: Optional[Tuple[Any, ...]] = None,
-    conn: Optional[psycopg.Connection] = None,
+    conn: Optional[AsyncConnection] = None,
+    analyze: bool = True,
 ) -> List[Dict[str, Any]]:
-    """Executes EXPLAIN ANALYZE (FORMAT JSON). Uses provided connection or creates a new one."""
-    explain_template = SQL(
-        cast(LiteralString, "EXPLAIN (ANALYZE, VERBOSE, BUFFERS, FORMAT JSON) {}")
-    )
-    explain_sql = explain_template.format(SQL(cast(LiteralString, sql)))
-    logger.info(
-        f"Getting EXPLAIN ANALYZE JSON for: {sql}"
-        + (f" with params: {params}" if params else "")
-    )
-    plan_result: List[Dict[str, Any]] = []
+    """Executes EXPLAIN ANALYZE. Uses provided connection or acquires one from the pool.
+
+    Returns the JSON plan list directly (one entry per statement), without
+    the single-row "QUERY PLAN" wrapper PostgreSQL returns it in.
+
+    Args:
+        analyze: When False, runs a plain EXPLAIN — the planner's estimates
+            without executing the query. Use for callers that only need plan
+            structure and shouldn't pay (or risk) the execution.
+    """
+    template = _EXPLAIN_TEMPLATE if analyze else _EXPLAIN_NO_ANALYZE_TEMPLATE
+    explain_sql = template.format(SQL(cast(LiteralString, sql)))
 
-    def _fetch_plan_json(cursor: psycopg.Cursor[rows.DictRow]) -> List[Dict[str, Any]]:
-        cursor.execute(explain_sql, params)
-        fetched_plan = cursor.fetchall()
-        if not fetched_plan or not fetched_plan[0]:
-            logger.error(f"EXPLAIN ANALYZE for query '{sql}' returned no plan data.")
-            raise psycopg.Error("EXPLAIN ANALYZE did not return any plan data.")
-        return fetched_plan
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Getting EXPLAIN ANALYZE for: %s%s",
+            sql,
+            f" with params: {params}" if params else "",
+        )
+    plan: List[Dict[str, Any]] = []
+
+    async def _fetch_plan(cursor: psycopg.AsyncCursor) -> List[Dict[str, Any]]:
+        await cursor.execute(explain_sql, params)
+        fetched_plan = await cursor.fetchone()
+        if not fetched_plan:
+            logger.error("EXPLAIN ANALYZE for query '%s' returned no plan.", sql)
+            raise psycopg.Error("EXPLAIN ANALYZE did not return any plan.")
+        return fetched_plan[0]
 
     try:
         if conn:
-            with conn.cursor(row_factory=rows.dict_row) as cur:
-                plan_result = _fetch_plan_json(cur)
+            async with conn.cursor() as cur:
+                plan = await _fetch_plan(cur)
         else:
-            with get_db_connection() as new_conn:
-                with new_conn.cursor(row_factory=rows.dict_row) as cur:
-                    plan_result = _fetch_plan_json(cur)
+            async with get_db_connection() as new_conn:
+                async with new_conn.cursor() as cur:
+                    plan = await _fetch_plan(cur)
     except psycopg.Error as e:
-        logger.error(f"Failed to execute EXPLAIN ANALYZE for query: {sql}. Error: {e}")
+        logger.error(
+            "Failed to execute EXPLAIN ANALYZE for query: %s. Error: %s", sql, e
+        )
         raise
-    return plan_result
+
+    return plan
 
 
-def list_tables(conn: Optional[psycopg.Connection] = None) -> List[str]:
-    """Lists all tables in the public schema. Uses provided connection or creates a new one."""
-    sql = "SELECT table_name FROM information_schema.tables WHERE table_schema = 'public';"
+async def list_tables(conn: Optional[AsyncConnection] = None) -> List[str]:
+    """Lists all tables in the public schema. Uses provided connection or acquires one from the pool."""
     logger.info("Listing tables in public schema")
     table_names: List[str] = []
 
-    def _fetch_tables(cursor: psycopg.Cursor):
-        cursor.execute(sql)
-        results = cursor.fetchall()
+    async def _fetch_tables(cursor: psycopg.AsyncCursor) -> List[str]:
+        await cursor.execute(_LIST_TABLES_SQL, prepare=True)
+        results = await cursor.fetchall()
         return [row[0] for row in results]
 
     try:
         if conn:
-            with conn.cursor() as cur:
-                table_names = _fetch_tables(cur)
+            async with conn.cursor() as cur:
+                table_names = await _fetch_tables(cur)
         else:
-            with get_db_connection() as new_conn:
-                with new_conn.cursor() as cur:
-                    table_names = _fetch_tables(cur)
+            async with get_db_connection() as new_conn:
+                async with new_conn.cursor() as cur:
+                    table_names = await _fetch_tables(cur)
     except psycopg.Error as e:
-        logger.error(f"Failed to list tables. Error: {e}")
+        logger.error("Failed to list tables. Error: %s", e)
         raise
     return table_names
 
 
-def get_table_schema(
-    table_name: str, conn: Optional[psycopg.Connection] = None
+async def get_table_schema(
+    table_name: str, conn: Optional[AsyncConnection] = None
 ) -> Dict[str, str]:
-    """Retrieves the schema for a table. Uses provided connection or creates a new one."""
-    sql = "SELECT column_name, data_type FROM information_schema.columns WHERE table_name = %s AND table_schema = 'public';"
-    logger.info(f"Getting schema for table: {table_name}")
+    """Retrieves the schema for a table. Uses provided connection or acquires one from the pool."""
+    logger.info("Getting schema for table: %s", table_name)
     schema: Dict[str, str] = {}
 
-    def _fetch_schema(cursor: psycopg.Cursor):
-        cursor.execute(sql, (table_name,))
-        results = cursor.fetchall()
+    async def _fetch_schema(cursor: psycopg.AsyncCursor) -> Dict[str, str]:
+        await cursor.execute(_TABLE_SCHEMA_SQL, (table_name,), prepare=True)
+        results = await cursor.fetchall()
         if not results:
-            logger.warning(f"Table '{table_name}' not found or has no columns.")
+            logger.warning("Table '%s' not found or has no columns.", table_name)
         return {row[0]: row[1] for row in results}
 
     try:
         if conn:
-            with conn.cursor() as cur:
-                schema = _fetch_schema(cur)
+            async with conn.cursor() as cur:
+                schema = await _fetch_schema(cur)
         else:
-            with get_db_connection() as new_conn:
-                with new_conn.cursor() as cur:
-                    schema = _fetch_schema(cur)
+            async with get_db_connection() as new_conn:
+                async with new_conn.cursor() as cur:
+                    schema = await _fetch_schema(cur)
     except psycopg.Error as e:
-        logger.error(f"Failed to get schema for table {table_name}. Error: {e}")
+        logger.error("Failed to get schema for table %s. Error: %s", table_name, e)
         raise
     return schema
 
 
-def get_table_indexes(
-    table_name: str, conn: Optional[psycopg.Connection] = None
+async def get_table_indexes(
+    table_name: str, conn: Optional[AsyncConnection] = None
 ) -> List[str]:
-    """Retrieves index names for a table. Uses provided connection or creates a new one."""
-    sql = "SELECT indexname FROM pg_indexes WHERE tablename = %s AND schemaname = 'public';"
-    logger.info(f"Getting indexes for table: {table_name}")
+    """Retrieves index names for a table. Uses provided connection or acquires one from the pool."""
+    logger.info("Getting indexes for table: %s", table_name)
     index_names: List[str] = []
 
-    def _fetch_indexes(cursor: psycopg.Cursor):
-        cursor.execute(sql, (table_name,))
-        results = cursor.fetchall()
+    async def _fetch_indexes(cursor: psycopg.AsyncCursor) -> List[str]:
+        await cursor.execute(_TABLE_INDEXES_SQL, (table_name,), prepare=True)
+        results = await cursor.fetchall()
         return [row[0] for row in results]
 
     try:
         if conn:
-            with conn.cursor() as cur:
-                index_names = _fetch_indexes(cur)
+            async with conn.cursor() as cur:
+                index_names = await _fetch_indexes(cur)
         else:
-            with get_db_connection() as new_conn:
-                with new_conn.cursor() as cur:
-                    index_names = _fetch_indexes(cur)
+            async with get_db_connection() as new_conn:
+                async with new_conn.cursor() as cur:
+                    index_names = await _fetch_indexes(cur)
     except psycopg.Error as e:
-        logger.error(f"Failed to get indexes for table {table_name}. Error: {e}")
+        logger.error("Failed to get indexes for table %s. Error: %s", table_name, e)
         raise
     return index_names
+
+
+# Above this many tables, one ANY(%s) query beats per-table concurrency.
+_BULK_METADATA_THRESHOLD = 4
+
+
+async def gather_metadata(
+    table_names: List[str],
+) -> Tuple[Dict[str, Dict[str, str]], Dict[str, List[str]]]:
+    """Fetches schemas and indexes for a set of tables concurrently.
+
+    Small sets fan out over separate pool connections with asyncio.gather,
+    so the wall-clock cost is the slowest query rather than the sum; larger
+    sets fall back to the single-round-trip bulk queries.
+
+    Returns:
+        A (schemas, indexes) tuple keyed by table name.
+    """
+    if len(table_names) > _BULK_METADATA_THRESHOLD:
+        schemas, indexes = await asyncio.gather(
+            get_schemas_bulk(table_names), get_indexes_bulk(table_names)
+        )
+        return schemas, indexes
+    schema_results, index_results = await asyncio.gather(
+        asyncio.gather(*(get_table_schema(t) for t in table_names)),
+        asyncio.gather(*(get_table_indexes(t) for t in table_names)),
+    )
+    return dict(zip(table_names, schema_results)), dict(zip(table_names, index_results))
+
+
+async def get_schemas_bulk(
+    table_names: List[str], conn: Optional[AsyncConnection] = None
+) -> Dict[str, Dict[str, str]]:
+    """Retrieves the schemas for several tables in a single round-trip."""
+    logger.info("Getting schemas for %d tables", len(table_names))
+    schemas: Dict[str, Dict[str, str]] = defaultdict(dict)
+
+    async def _fetch_schemas(cursor: psycopg.AsyncCursor) -> None:
+        await cursor.execute(_SCHEMAS_BULK_SQL, (table_names,), prepare=True)
+        for table_name, column_name, data_type in await cursor.fetchall():
+            schemas[table_name][column_name] = data_type
+
+    try:
+        if conn:
+            async with conn.cursor() as cur:
+                await _fetch_schemas(cur)
+        else:
+            async with get_db_connection() as new_conn:
+                async with new_conn.cursor() as cur:
+                    await _fetch_schemas(cur)
+    except psycopg.Error as e:
+        logger.error("Failed to get schemas for tables %s. Error: %s", table_names, e)
+        raise
+    return dict(schemas)
+
+
+async def get_indexes_bulk(
+    table_names: List[str], conn: Optional[AsyncConnection] = None
+) -> Dict[str, List[str]]:
+    """Retrieves the index names for several tables in a single round-trip."""
+    logger.info("Getting indexes for %d tables", len(table_names))
+    indexes: Dict[str, List[str]] = defaultdict(list)
+
+    async def _fetch_indexes_bulk(cursor: psycopg.AsyncCursor) -> None:
+        await cursor.execute(_INDEXES_BULK_SQL, (table_names,), prepare=True)
+        for table_name, index_name in await cursor.fetchall():
+            indexes[table_name].append(index_name)
+
+    try:
+        if conn:
+            async with conn.cursor() as cur:
+                await _fetch_indexes_bulk(cur)
+        else:
+            async with get_db_connection() as new_conn:
+                async with new_conn.cursor() as cur:
+                    await _fetch_indexes_bulk(cur)
+    except psycopg.Error as e:
+        logger.error("Failed to get indexes for tables %s. Error: %s", table_names, e)
+        raise
+    return dict(indexes)
@@ -0,0 +1,79 @@
+import re
+import logging
+from typing import Any, Dict, Iterator, List, Optional
+
+from elaiphant.agent import OptimizationSuggestion
+
+logger = logging.getLogger(__name__)
+
+# A Seq Scan discarding at least this many rows to a filter is worth an index.
+_ROWS_REMOVED_THRESHOLD = 10000
+
+# First column referenced in a Filter expression like "(orders.status = 'open')".
+_FILTER_COLUMN_RE = re.compile(r"\(?\s*(?:\w+\.)?(\w+)\s*(?:[=<>!~]|IS\b|LIKE\b)")
+
+
+def _iter_plan_nodes(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Yields every node in a plan tree, depth-first."""
+    yield node
+    for child in node.get("Plans", []):
+        yield from _iter_plan_nodes(child)
+
+
+def plan_depth(node: Dict[str, Any]) -> int:
+    """Returns the depth of a plan tree (a single node has depth 1)."""
+    children = node.get("Plans", [])
+    if not children:
+        return 1
+    return 1 + max(plan_depth(child) for child in children)
+
+
+def cheap_suggestions(
+    plan: Dict[str, Any],
+    indexes: Optional[Dict[str, List[str]]] = None,
+) -> List[OptimizationSuggestion]:
+    """Derives mechanical optimization suggestions from a JSON plan, no LLM needed.
+
+    Currently: a Seq Scan that filters away a large number of rows on a
+    column with no matching index gets a CREATE INDEX suggestion.
+
+    Args:
+        plan: A single EXPLAIN (FORMAT JSON) plan entry (the dict with 'Plan').
+        indexes: Optional map of table name to its index names; when given,
+            columns already covered by an index name are skipped.
+
+    Returns:
+        A list of OptimizationSuggestion, possibly empty.
+    """
+    root = plan.get("Plan", plan)
+    suggestions: List[OptimizationSuggestion] = []
+
+    for node in _iter_plan_nodes(root):
+        if node.get("Node Type") != "Seq Scan":
+            continue
+        if node.get("Rows Removed by Filter", 0) <= _ROWS_REMOVED_THRESHOLD:
+            continue
+        table = node.get("Relation Name")
+        filter_expr = node.get("Filter")
+        if not table or not filter_expr:
+            continue
+        match = _FILTER_COLUMN_RE.search(filter_expr)
+        if not match:
+            continue
+        column = match.group(1)
+        table_indexes = (indexes or {}).get(table, [])
+        if any(column in index_name for index_name in table_indexes):
+            continue
+        logger.debug(
+            "Heuristic index suggestion for %s.%s (filter: %s)",
+            table,
+            column,
+            filter_expr,
+        )
+        suggestions.append(
+            OptimizationSuggestion(
+                suggestion_type="index",
+                description=f"CREATE INDEX ON {table} ({column});",
+            )
+        )
+    return suggestions
@@ -1,7 +1,6 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import PostgresDsn, Field
+from pydantic import PostgresDsn, Field, model_validator
 from typing import Optional
-from pydantic_ai.models import KnownModelName
 
 
 class Settings(BaseSettings):
@@ -9,11 +8,35 @@ class Settings(BaseSettings):
 
     database_url: Optional[PostgresDsn] = Field(default=None)
 
-    ai_model: KnownModelName = Field(
+    # str(database_url) computed once per instance; PostgresDsn rebuilds the
+    # string representation on every str() call otherwise.
+    dsn_str: str = Field(default="", exclude=True)
+
+    # Model fields are plain strings (pydantic-ai KnownModelName values);
+    # annotating with KnownModelName itself would drag the whole pydantic_ai
+    # package (and its provider adapters) into this module's import.
+    ai_model: str = Field(
         default="openai:gpt-4o",
         description="LLM model string to use (e.g., openai:gpt-4o).",
     )
 
+    ai_model_fast: str = Field(
+        default="openai:gpt-4o-mini",
+        description="Cheaper/faster model used for first-pass triage.",
+    )
+
+    ai_model_strong: Optional[str] = Field(
+        default=None,
+        description="Model to escalate to on low confidence; defaults to ai_model.",
+    )
+
+    @model_validator(mode="after")
+    def _set_dsn_str(self) -> "Settings":
+        object.__setattr__(
+            self, "dsn_str", str(self.database_url) if self.database_url else ""
+        )
+        return self
+
     model_config = SettingsConfigDict(
         env_prefix="ELAIPHANT_",
         env_file=".env",
@@ -22,4 +45,24 @@ class Settings(BaseSettings):
     )
 
 
-settings = Settings()
+_settings: Optional[Settings] = None
+
+
+def get_settings() -> Settings:
+    """Returns the process-wide Settings instance, creating it on first use.
+
+    Lazy so that importing this module (e.g. for the CLI's --help path or
+    test collection) doesn't pay for env/.env parsing and validation.
+    """
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
+
+
+def __getattr__(name: str) -> Settings:
+    # Back-compat: `from elaiphant.settings import settings` resolves to the
+    # lazily-created singleton.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
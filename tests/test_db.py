@@ -1,98 +1,287 @@
 import pytest
-import psycopg
+import pytest_asyncio
+
+# Only the connection type is needed here; elaiphant.db (via conftest)
+# already imports the full psycopg package at collection time anyway.
+from psycopg import AsyncConnection
 
 
 from elaiphant.db import (
+    batch_execute,
+    compact_plan,
+    copy_from,
+    execute_many,
     execute_query,
     get_explain_analyze,
+    get_explain_analyze_cached,
+    clear_explain_cache,
+    normalize_sql,
     get_db_connection,
+    gather_query_context,
+    stream_query,
     list_tables,
     get_table_schema,
     get_table_indexes,
+    get_schemas_bulk,
+    get_indexes_bulk,
+    gather_metadata,
 )
 
 
-def test_execute_query_select_1():
-    """should execute a simple SELECT query correctly."""
-    results = execute_query("SELECT 1 AS number;")
-    assert len(results) == 1
-    assert results[0]["number"] == 1
+# Shared statements as module constants: stable keys for psycopg's
+# prepared-statement cache across repeated/parameterized runs.
+_Q_SELECT_ONE = "SELECT 1 AS number;"
+_Q_SELECT_PARAM = "SELECT %s AS value;"
+_Q_TRIVIAL = "SELECT 1;"
+_Q_CAST_PARAM = "SELECT %s::int;"
+
 
+@pytest.mark.parametrize(
+    ("sql", "params", "expected"),
+    [
+        (_Q_SELECT_ONE, None, [{"number": 1}]),
+        (_Q_SELECT_PARAM, ("hello",), [{"value": "hello"}]),
+    ],
+)
+async def test_execute_query(sql, params, expected):
+    """should execute simple and parameterized SELECT queries correctly."""
+    # binary=True is safe here: int and text both have binary send/recv.
+    assert await execute_query(sql, params, binary=True) == expected
 
-def test_execute_query_no_results():
+
+async def test_execute_query_no_results():
     """should handle queries that return no rows."""
-    try:
-        with get_db_connection() as conn:
-            with conn.cursor(row_factory=psycopg.rows.dict_row) as cur:
-                cur.execute("DROP TABLE IF EXISTS test_empty_query;")
-                cur.execute("CREATE TEMP TABLE test_empty_query (id INT);")
-                cur.execute("SELECT * FROM test_empty_query;")
-                results = cur.fetchall()
-                assert results == []
-    except (psycopg.Error, ConnectionError) as e:
-        pytest.fail(
-            f"Database operation failed during test_execute_query_no_results: {e}"
+    async with get_db_connection() as conn:
+        # An always-false predicate yields an empty result set without the
+        # DDL (and catalog churn) of creating an empty table. conn.execute
+        # runs on an internal cursor — no explicit cursor context needed —
+        # and rowcount asserts emptiness without fetchall's list build.
+        cur = await conn.execute("SELECT 1 AS id WHERE false;")
+        assert cur.rowcount == 0
+
+
+async def test_batch_execute():
+    """should run several queries in one pipelined flush, results in order."""
+    results = await batch_execute(
+        [
+            (_Q_SELECT_ONE, None),
+            (_Q_SELECT_PARAM, ("hello",)),
+            ("SELECT 2 AS number;", None),
+        ]
+    )
+    assert results == [
+        [{"number": 1}],
+        [{"value": "hello"}],
+        [{"number": 2}],
+    ]
+
+
+async def test_stream_query():
+    """should stream rows in chunks via a server-side cursor."""
+    values = [
+        row["n"]
+        async for row in stream_query(
+            "SELECT generate_series(1, 5000) AS n;", itersize=100
         )
+    ]
+    assert values == list(range(1, 5001))
 
 
-def test_execute_query_with_params():
-    """should execute a query with parameters correctly."""
-    results = execute_query("SELECT %s AS value;", ("hello",))
-    assert len(results) == 1
-    assert results[0]["value"] == "hello"
+@pytest_asyncio.fixture(scope="module")
+async def trivial_plan():
+    """EXPLAIN plan for a trivial query, fetched once and shared.
 
+    analyze=False: the consuming tests only inspect plan structure, so
+    there is no need to actually execute the query.
+    """
+    return await get_explain_analyze(_Q_TRIVIAL, analyze=False)
 
-def test_get_explain_analyze_basic():
-    """should retrieve an EXPLAIN ANALYZE plan in JSON format."""
-    plan_result = get_explain_analyze("SELECT 1;")
-    assert isinstance(plan_result, list)
-    assert len(plan_result) == 1
-    assert isinstance(plan_result[0], dict)
-    assert "QUERY PLAN" in plan_result[0]
-    assert isinstance(plan_result[0]["QUERY PLAN"], list)
-    assert len(plan_result[0]["QUERY PLAN"]) > 0
+
+async def test_get_explain_analyze_shape(trivial_plan):
+    """should return the JSON plan as a one-entry list of dicts."""
+    # Indexing below implies list-ness; one equality covers the shape.
+    assert len(trivial_plan) == 1
+    assert isinstance(trivial_plan[0], dict)
 
 
-def test_get_explain_analyze_with_params():
-    """should retrieve an EXPLAIN ANALYZE plan for a query with parameters."""
-    plan_result = get_explain_analyze("SELECT %s::int;", (42,))
-    assert isinstance(plan_result, list)
+async def test_get_explain_analyze_plan_tree(trivial_plan):
+    """should contain a plan tree with a node type."""
+    assert "Plan" in trivial_plan[0]
+    assert trivial_plan[0]["Plan"]["Node Type"]
+
+
+async def test_get_explain_analyze_with_params():
+    """should retrieve an EXPLAIN plan for a query with parameters."""
+    plan_result = await get_explain_analyze(_Q_CAST_PARAM, (42,), analyze=False)
     assert len(plan_result) == 1
-    assert "QUERY PLAN" in plan_result[0]
-    assert isinstance(plan_result[0]["QUERY PLAN"], list)
+    assert "Plan" in plan_result[0]
+
+
+def test_compact_plan():
+    """should keep high-signal plan fields and drop the rest, recursively."""
+    plan = {
+        "Plan": {
+            "Node Type": "Hash Join",
+            "Join Type": "Inner",
+            "Output": ["a.id", "b.id"],
+            "Schema": "public",
+            "Plans": [
+                {
+                    "Node Type": "Seq Scan",
+                    "Relation Name": "a",
+                    "Alias": "a",
+                    "Filter": "(a.x > 10)",
+                    "Rows Removed by Filter": 12345,
+                }
+            ],
+        },
+        "Execution Time": 1.23,
+        "Planning Time": 0.45,
+    }
+
+    compacted = compact_plan(plan)
+
+    assert compacted["Execution Time"] == 1.23
+    assert "Planning Time" not in compacted
+    assert compacted["Plan"]["Node Type"] == "Hash Join"
+    assert "Output" not in compacted["Plan"]
+    assert "Schema" not in compacted["Plan"]
+    child = compacted["Plan"]["Plans"][0]
+    assert child == {
+        "Node Type": "Seq Scan",
+        "Relation Name": "a",
+        "Filter": "(a.x > 10)",
+        "Rows Removed by Filter": 12345,
+    }
+
+
+async def test_gather_query_context():
+    """should collect the plan and table metadata in one call."""
+    context = await gather_query_context(_Q_TRIVIAL)
+    assert set(context) == {"plan", "tables", "schemas", "indexes"}
+    assert "Plan" in context["plan"][0]
+    assert isinstance(context["tables"], list)
+
+
+def test_normalize_sql():
+    """should strip comments and collapse whitespace for cache keying."""
+    sql = "SELECT  1\n-- a comment\n  /* block */ AS   number;"
+    assert normalize_sql(sql) == "SELECT 1 AS number;"
 
 
-def test_list_tables(db_connection: psycopg.Connection):
+async def test_get_explain_analyze_cached():
+    """should return the memoized plan on a repeat call."""
+    clear_explain_cache()
+    sql = "SELECT 1 AS cached;"
+    first = await get_explain_analyze_cached(sql)
+    second = await get_explain_analyze_cached("SELECT 1   AS cached;")
+    assert second is first
+    clear_explain_cache()
+
+
+async def test_execute_many(db_connection: AsyncConnection):
+    """should insert all parameter sets in one batched call."""
+    async with db_connection.cursor() as cur:
+        await cur.execute("CREATE TABLE test_batch (id INT, name TEXT);")
+
+    await execute_many(
+        "INSERT INTO test_batch (id, name) VALUES (%s, %s);",
+        [(1, "a"), (2, "b"), (3, "c")],
+        conn=db_connection,
+    )
+
+    results = await execute_query(
+        "SELECT count(*) AS count FROM test_batch;", conn=db_connection
+    )
+    assert results == [{"count": 3}]
+
+
+async def test_copy_from(db_connection: AsyncConnection):
+    """should bulk-load rows via the COPY protocol."""
+    async with db_connection.cursor() as cur:
+        await cur.execute("CREATE TABLE test_copy (id INT, name TEXT);")
+
+    await copy_from(
+        "test_copy",
+        ["id", "name"],
+        [(i, f"row-{i}") for i in range(100)],
+        conn=db_connection,
+    )
+
+    results = await execute_query(
+        "SELECT count(*) AS count FROM test_copy;", conn=db_connection
+    )
+    assert results == [{"count": 100}]
+
+
+async def test_list_tables(db_connection: AsyncConnection):
     """Should list tables created in the public schema."""
     table_name = "test_list_table"
-    with db_connection.cursor() as cur:
-        cur.execute(f"CREATE TABLE {table_name} (id serial primary key);")
+    async with db_connection.cursor() as cur:
+        await cur.execute(f"CREATE TABLE {table_name} (id serial primary key);")
 
-    tables = list_tables(conn=db_connection)
+    tables = await list_tables(conn=db_connection)
     assert table_name in tables
 
 
-def test_get_table_schema(db_connection: psycopg.Connection):
+async def test_get_table_schema(db_connection: AsyncConnection):
     """Should retrieve the correct schema for a given table."""
     table_name = "test_schema_table"
-    with db_connection.cursor() as cur:
-        cur.execute(
+    async with db_connection.cursor() as cur:
+        await cur.execute(
             f"CREATE TABLE {table_name} (id serial primary key, name text, value integer);"
         )
 
-    schema = get_table_schema(table_name, conn=db_connection)
+    schema = await get_table_schema(table_name, conn=db_connection)
     assert schema == {"id": "integer", "name": "text", "value": "integer"}
 
 
-def test_get_table_indexes(db_connection: psycopg.Connection):
+async def test_get_schemas_bulk(db_connection: AsyncConnection):
+    """Should retrieve schemas for several tables in one query."""
+    async with db_connection.cursor() as cur:
+        await cur.execute("CREATE TABLE bulk_a (id serial primary key, name text);")
+        await cur.execute("CREATE TABLE bulk_b (id serial primary key, value integer);")
+
+    schemas = await get_schemas_bulk(["bulk_a", "bulk_b"], conn=db_connection)
+    assert schemas["bulk_a"] == {"id": "integer", "name": "text"}
+    assert schemas["bulk_b"] == {"id": "integer", "value": "integer"}
+
+
+async def test_get_indexes_bulk(db_connection: AsyncConnection):
+    """Should retrieve index names for several tables in one query."""
+    async with db_connection.cursor() as cur:
+        await cur.execute("CREATE TABLE bulk_c (id serial primary key);")
+        await cur.execute("CREATE TABLE bulk_d (id serial primary key);")
+
+    indexes = await get_indexes_bulk(["bulk_c", "bulk_d"], conn=db_connection)
+    assert indexes["bulk_c"] == ["bulk_c_pkey"]
+    assert indexes["bulk_d"] == ["bulk_d_pkey"]
+
+
+async def test_gather_metadata(db_connection: AsyncConnection):
+    """Should fetch schemas and indexes for several tables concurrently."""
+    async with db_connection.cursor() as cur:
+        await cur.execute("CREATE TABLE meta_a (id serial primary key, name text);")
+        await cur.execute("CREATE TABLE meta_b (id serial primary key);")
+    # Commit so the concurrent pool connections can see the tables.
+    await db_connection.commit()
+
+    schemas, indexes = await gather_metadata(["meta_a", "meta_b"])
+    assert schemas["meta_a"] == {"id": "integer", "name": "text"}
+    assert indexes["meta_b"] == ["meta_b_pkey"]
+
+
+async def test_get_table_indexes(db_connection: AsyncConnection):
     """Should retrieve the correct indexes for a given table."""
     table_name = "test_index_table"
     index_name = "idx_test_index_table_name"
-    with db_connection.cursor() as cur:
-        cur.execute(f"CREATE TABLE {table_name} (id serial primary key, name text);")
-        cur.execute(f"CREATE INDEX {index_name} ON {table_name} (name);")
+    async with db_connection.cursor() as cur:
+        await cur.execute(
+            f"CREATE TABLE {table_name} (id serial primary key, name text);"
+        )
+        await cur.execute(f"CREATE INDEX {index_name} ON {table_name} (name);")
 
-    indexes = get_table_indexes(table_name, conn=db_connection)
+    indexes = await get_table_indexes(table_name, conn=db_connection)
 
     # Check for both the primary key index (name might vary) and the explicit index
     assert index_name in indexes
@@ -0,0 +1,46 @@
+from elaiphant.heuristics import cheap_suggestions, plan_depth
+
+
+def _seq_scan_plan(rows_removed: int) -> dict:
+    return {
+        "Plan": {
+            "Node Type": "Seq Scan",
+            "Relation Name": "orders",
+            "Filter": "(orders.status = 'open')",
+            "Rows Removed by Filter": rows_removed,
+        }
+    }
+
+
+def test_cheap_suggestions_unindexed_filter():
+    """should suggest an index for a Seq Scan discarding many rows."""
+    suggestions = cheap_suggestions(_seq_scan_plan(50000))
+    assert len(suggestions) == 1
+    assert suggestions[0].suggestion_type == "index"
+    assert suggestions[0].description == "CREATE INDEX ON orders (status);"
+
+
+def test_cheap_suggestions_below_threshold():
+    """should stay quiet when the filter only discards a few rows."""
+    assert cheap_suggestions(_seq_scan_plan(10)) == []
+
+
+def test_cheap_suggestions_already_indexed():
+    """should not re-suggest an index that already covers the column."""
+    suggestions = cheap_suggestions(
+        _seq_scan_plan(50000), indexes={"orders": ["idx_orders_status"]}
+    )
+    assert suggestions == []
+
+
+def test_plan_depth():
+    """should measure the depth of a nested plan tree."""
+    plan = {
+        "Node Type": "Hash Join",
+        "Plans": [
+            {"Node Type": "Seq Scan"},
+            {"Node Type": "Hash", "Plans": [{"Node Type": "Seq Scan"}]},
+        ],
+    }
+    assert plan_depth(plan) == 3
+    assert plan_depth({"Node Type": "Result"}) == 1